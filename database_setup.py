@@ -1,6 +1,4 @@
 import sqlite3
-from datetime import datetime
-from pathlib import Path
 
 
 class DatabaseSetup:
@@ -65,17 +63,34 @@ class DatabaseSetup:
             CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status)
         """)
 
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tickets_customer_status ON tickets(customer_id, status)
+        """)
+
+        # Covering index for a customer's ticket history, newest first
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tickets_customer_created
+            ON tickets(customer_id, created_at DESC, id DESC, issue, status, priority)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_customers_status_name ON customers(status, name)
+        """)
+
         self.conn.commit()
         print("Tables created successfully!")
 
     def create_triggers(self):
         """Create triggers for automatic timestamp updates."""
 
-        # Trigger to update updated_at on customers table
+        # Trigger to update updated_at on customers table. The UPDATE
+        # statements in the MCP server never set updated_at themselves; the
+        # WHEN clause skips the extra write if a caller ever does.
         self.cursor.execute("""
             CREATE TRIGGER IF NOT EXISTS update_customer_timestamp
             AFTER UPDATE ON customers
             FOR EACH ROW
+            WHEN NEW.updated_at IS OLD.updated_at
             BEGIN
                 UPDATE customers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
             END